@@ -378,6 +378,8 @@ def topological_sort(graph, visualize=False, delay=0.5):
     
     Parameters:
     - graph: 隣接リスト表現のグラフ {ノード: [隣接ノードのリスト]}
+      （ノードは0からn-1の番号。graph[i] で隣接ノードを列挙できればよいので、
+      13_ダイクストラ法.py の CSRGraph もそのまま渡せる）
     
     Returns:
     - トポロジカルソート順のノードリスト
@@ -36,6 +36,114 @@ H×Wのグリッドがあります。各マスは'.'（通路）か'#'（壁）
 """
 
 from collections import deque
+import heapq
+import math
+
+def bfs(graph, start):
+    """
+    隣接リストで表したグラフの幅優先探索で、startから各頂点への最短距離を求める
+    
+    graph[u] で頂点uの隣接頂点を列挙できればよいので、
+    リストのリストでも、13_ダイクストラ法.py の CSRGraph でもそのまま使える。
+    到達できない頂点の距離は-1。
+    """
+    dist = [-1] * len(graph)
+    dist[start] = 0
+    queue = deque([start])
+    
+    while queue:
+        u = queue.popleft()
+        for v in graph[u]:
+            # 未訪問の頂点だけ距離を決めてキューに入れる
+            if dist[v] == -1:
+                dist[v] = dist[u] + 1
+                queue.append(v)
+    
+    return dist
+
+# A*探索で使う、ゴールまでの残りコストの見積もり（実際のコストを超えない）
+SQRT2 = math.sqrt(2)
+HEURISTICS = {
+    # 上下左右の移動のみ: 縦横の差の和
+    'manhattan': lambda dy, dx: dy + dx,
+    # 斜め移動あり（コスト√2）: 斜めに進める分は斜めに、残りはまっすぐ進む
+    'octile': lambda dy, dx: max(dy, dx) + (SQRT2 - 1) * min(dy, dx),
+    # 常に0: ダイクストラ法と同じ
+    'zero': lambda dy, dx: 0,
+}
+
+def grid_astar(grid, start, goal, heuristic=None, cost=None, diagonal=False):
+    """
+    グリッド上のA*探索で、スタートからゴールまでの最短経路を求める
+    
+    BFS（やダイクストラ法）はスタートから近い順にすべてのマスを調べるが、
+    A*探索は「スタートからの距離 + ゴールまでの見積もり」が小さいマスから調べるので、
+    ゴールの方向へ向かうマスを優先して調べ、調べるマスの数が大幅に減る。
+    見積もりが実際のコストを超えない限り、求まる距離はBFSと同じになる。
+    f が同じマスの間では、見積もり h が小さい（ゴールに近い）マスを先に調べる。
+    
+    隣接リストは作らず、マスの上下左右（と斜め）をその場で計算する。
+    
+    Parameters:
+    - grid: グリッド（'#'は壁）
+    - start, goal: (y, x)
+    - heuristic: 'manhattan' / 'octile' / 'zero'、または関数 h(dy, dx)
+      （dy, dx はゴールまでの縦・横の差の絶対値）。
+      省略時は diagonal=False なら 'manhattan'、True なら 'octile'
+    - cost: マスに入るコスト cost[y][x]（1以上）。省略時はすべて1
+    - diagonal: True なら斜めにも移動できる（コストは入るマスのコストの√2倍）
+    
+    Returns:
+    - (最短距離, 最短経路のリスト)。到達できなければ (-1, [])
+    """
+    H, W = len(grid), len(grid[0])
+    if heuristic is None:
+        heuristic = 'octile' if diagonal else 'manhattan'
+    if isinstance(heuristic, str):
+        heuristic = HEURISTICS[heuristic]
+    
+    directions = [(-1, 0, 1), (1, 0, 1), (0, -1, 1), (0, 1, 1)]  # (dy, dx, 倍率)
+    if diagonal:
+        directions += [(-1, -1, SQRT2), (-1, 1, SQRT2), (1, -1, SQRT2), (1, 1, SQRT2)]
+    
+    gy, gx = goal
+    # 調べたマスの分だけ記録する（グリッド全体の配列は作らない）
+    dist = {start: 0}
+    prev = {start: None}
+    h = heuristic(abs(start[0] - gy), abs(start[1] - gx))
+    queue = [(h, h, 0, start)]  # (f = 距離 + 見積もり, 見積もり, 距離, マス)
+    
+    while queue:
+        _, _, g, current = heapq.heappop(queue)
+        # 後からより短い距離が見つかったマスは飛ばす
+        if g > dist[current]:
+            continue
+        if current == goal:
+            break
+        
+        y, x = current
+        for dy, dx, scale in directions:
+            ny, nx = y + dy, x + dx
+            if not (0 <= ny < H and 0 <= nx < W) or grid[ny][nx] == '#':
+                continue
+            new_g = g + (cost[ny][nx] if cost else 1) * scale
+            if new_g < dist.get((ny, nx), math.inf):
+                dist[(ny, nx)] = new_g
+                prev[(ny, nx)] = current
+                nh = heuristic(abs(ny - gy), abs(nx - gx))
+                heapq.heappush(queue, (new_g + nh, nh, new_g, (ny, nx)))
+    
+    if goal not in dist:
+        return -1, []
+    
+    # 経路復元
+    path = []
+    current = goal
+    while current is not None:
+        path.append(current)
+        current = prev[current]
+    path.reverse()
+    return dist[goal], path
 
 def solve():
     # 入力を受け取る
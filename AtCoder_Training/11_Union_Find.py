@@ -38,6 +38,11 @@ p=1のクエリに対する結果を、各行に出力
 1
 """
 
+from array import array
+from multiprocessing import Pool
+import os
+import sys
+
 class UnionFind:
     """
     Union-Find木（素集合データ構造）の実装
@@ -47,19 +52,42 @@ class UnionFind:
     - 要素が属する集合の代表元を見つける（find）
     - 2つの集合を併合する（unite）
     - 2つの要素が同じ集合に属するか判定する（same）
+    - 要素が属する集合の大きさを求める（size）
+    - 要素が属する集合の要素を列挙する（members）
+    
+    by_size=True にすると、ランクの代わりに集合の大きさで併合の向きを決める。
+    compact=True にすると、各配列を array('i')（32bit整数の配列）で持つ。
+    values と operation を渡すと、各集合の要素の値を operation でまとめた結果
+    （和、最小値など）を unite のたびに更新し、aggregate で O(α(N)) で取り出せる。
     """
-    def __init__(self, n):
-        self.parent = list(range(n))  # 親の要素番号を格納（最初は自分自身）
-        self.rank = [0] * n  # ランク（木の高さ）を格納
+    def __init__(self, n, by_size=False, compact=False, values=None, operation=None):
+        if compact:
+            self.parent = array('i', range(n))  # 親の要素番号を格納（最初は自分自身）
+            self.rank = array('i', [0]) * n  # ランク（木の高さ）を格納
+            self.sizes = array('i', [1]) * n  # 根の要素に集合の大きさを格納
+            self.next = array('i', range(n))  # 同じ集合の要素を輪状につないだ「次の要素」
+        else:
+            self.parent = list(range(n))
+            self.rank = [0] * n
+            self.sizes = [1] * n
+            self.next = list(range(n))
+        self.by_size = by_size
+        self.count = n  # 集合の個数
+        # 根の要素に、その集合の値をまとめた結果を格納
+        self.values = list(values) if values is not None else None
+        self.operation = operation
     
     def find(self, x):
         """要素xが属する集合の根（代表元）を見つける"""
-        if self.parent[x] == x:
-            return x
-        else:
-            # 経路圧縮: 親を根に更新することで次回の検索を高速化
-            self.parent[x] = self.find(self.parent[x])
-            return self.parent[x]
+        parent = self.parent
+        # 1回目: 根までたどる（再帰を使わないので、長い鎖でも深さ制限にかからない）
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        # 2回目: 経路圧縮: 通った要素の親をすべて根に付け替える
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
     
     def unite(self, x, y):
         """要素xとyが属する集合を併合する"""
@@ -70,18 +98,467 @@ class UnionFind:
         if x_root == y_root:
             return
         
-        # ランク（木の高さ）の低い方を高い方につなぐ
-        if self.rank[x_root] < self.rank[y_root]:
-            self.parent[x_root] = y_root
+        if self.by_size:
+            # 小さい方の集合を大きい方につなぐ
+            if self.sizes[x_root] < self.sizes[y_root]:
+                x_root, y_root = y_root, x_root
         else:
-            self.parent[y_root] = x_root
+            # ランク（木の高さ）の低い方を高い方につなぐ
+            if self.rank[x_root] < self.rank[y_root]:
+                x_root, y_root = y_root, x_root
             # ランクが同じ場合、併合後のランクが1増加
             if self.rank[x_root] == self.rank[y_root]:
                 self.rank[x_root] += 1
+        self._link(x_root, y_root)
+    
+    def _link(self, x_root, y_root):
+        """根y_rootを根x_rootの下につなぎ、集合ごとの情報をまとめる"""
+        self.parent[y_root] = x_root
+        self.sizes[x_root] += self.sizes[y_root]
+        self.count -= 1
+        # 2つの輪の「次の要素」を入れ替えると、1つの大きな輪になる
+        self.next[x_root], self.next[y_root] = self.next[y_root], self.next[x_root]
+        if self.values is not None:
+            self.values[x_root] = self.operation(self.values[x_root], self.values[y_root])
+    
+    def same(self, x, y):
+        """要素xとyが同じ集合に属するかを判定する"""
+        return self.find(x) == self.find(y)
+    
+    def size(self, x):
+        """要素xが属する集合の大きさを求める"""
+        return self.sizes[self.find(x)]
+    
+    def members(self, x):
+        """要素xが属する集合の要素を列挙する（集合の大きさに比例する時間）"""
+        result = [x]
+        y = self.next[x]
+        while y != x:
+            result.append(y)
+            y = self.next[y]
+        return result
+    
+    def aggregate(self, x):
+        """要素xが属する集合の値を operation でまとめた結果を求める"""
+        return self.values[self.find(x)]
+
+
+class WeightedUnionFind(UnionFind):
+    """
+    重み付きUnion-Find木（ポテンシャル付きUnion-Find）の実装
+    
+    「value[y] - value[x] = w」という形の制約を次々に追加しながら、
+    制約が矛盾しないかの判定と、同じ集合の2要素の差 value[y] - value[x] を
+    ほぼ O(1) で求めるデータ構造
+    
+    各要素は親との差 weight[x] = value[x] - value[parent[x]] を持ち、
+    経路圧縮で親を根に付け替えるときに、根との差に更新する。
+    """
+    def __init__(self, n, by_size=False, compact=False, values=None, operation=None):
+        super().__init__(n, by_size, compact, values, operation)
+        self.weight = array('q', [0]) * n if compact else [0] * n
+    
+    def find(self, x):
+        """要素xが属する集合の根（代表元）を見つける"""
+        parent = self.parent
+        weight = self.weight
+        # 1回目: 根までたどり、通った要素を覚えておく
+        path = []
+        while parent[x] != x:
+            path.append(x)
+            x = parent[x]
+        root = x
+        # 2回目: 根に近い要素から順に、根との差に直しながら根に付け替える
+        acc = 0
+        for node in reversed(path):
+            acc += weight[node]
+            weight[node] = acc
+            parent[node] = root
+        return root
+    
+    def potential(self, x):
+        """value[x] - value[xの根] を求める"""
+        self.find(x)
+        return self.weight[x]
+    
+    def diff(self, x, y):
+        """value[y] - value[x] を求める（異なる集合なら None）"""
+        if not self.same(x, y):
+            return None
+        return self.weight[y] - self.weight[x]
+    
+    def unite(self, x, y, w):
+        """
+        制約 value[y] - value[x] = w を追加する
+        
+        これまでの制約と矛盾する場合は何もせず False を返す。
+        """
+        x_root = self.find(x)
+        y_root = self.find(y)
+        # 根同士の差 value[y_root] - value[x_root] に直す
+        w += self.weight[x] - self.weight[y]
+        
+        # 既に同じ集合の場合は、矛盾がないかだけを確かめる
+        if x_root == y_root:
+            return w == 0
+        
+        if self.by_size:
+            # 小さい方の集合を大きい方につなぐ
+            if self.sizes[x_root] < self.sizes[y_root]:
+                x_root, y_root, w = y_root, x_root, -w
+        else:
+            # ランク（木の高さ）の低い方を高い方につなぐ
+            if self.rank[x_root] < self.rank[y_root]:
+                x_root, y_root, w = y_root, x_root, -w
+            if self.rank[x_root] == self.rank[y_root]:
+                self.rank[x_root] += 1
+        self.weight[y_root] = w
+        self._link(x_root, y_root)
+        return True
+
+
+class RollbackUnionFind:
+    """
+    操作を取り消せるUnion-Find木の実装
+    
+    経路圧縮をすると1回の find で多くの親が書き換わり元に戻せないので、
+    経路圧縮はせず、大きさによる併合だけで木の高さを O(log N) に抑える。
+    unite のたびに書き換えた内容を履歴に積んでおき、
+    snapshot() で取った時点まで rollback() で戻せる。
+    """
+    def __init__(self, n):
+        self.parent = list(range(n))
+        self.sizes = [1] * n
+        self.history = []  # unite で書き換えた (つないだ根, つながれた根)。併合しなかったら None
+    
+    def find(self, x):
+        """要素xが属する集合の根（代表元）を見つける（O(log N)）"""
+        parent = self.parent
+        while parent[x] != x:
+            x = parent[x]
+        return x
+    
+    def unite(self, x, y):
+        """要素xとyが属する集合を併合し、併合したかどうかを返す"""
+        x_root = self.find(x)
+        y_root = self.find(y)
+        if x_root == y_root:
+            self.history.append(None)
+            return False
+        # 小さい方の集合を大きい方につなぐ
+        if self.sizes[x_root] < self.sizes[y_root]:
+            x_root, y_root = y_root, x_root
+        self.parent[y_root] = x_root
+        self.sizes[x_root] += self.sizes[y_root]
+        self.history.append((x_root, y_root))
+        return True
     
     def same(self, x, y):
         """要素xとyが同じ集合に属するかを判定する"""
         return self.find(x) == self.find(y)
+    
+    def size(self, x):
+        """要素xが属する集合の大きさを求める"""
+        return self.sizes[self.find(x)]
+    
+    def snapshot(self):
+        """現在の状態を表す値を返す（rollback に渡す）"""
+        return len(self.history)
+    
+    def rollback(self, state):
+        """snapshot() で取った状態まで unite を取り消す"""
+        history = self.history
+        while len(history) > state:
+            record = history.pop()
+            if record is not None:
+                x_root, y_root = record
+                self.parent[y_root] = y_root
+                self.sizes[x_root] -= self.sizes[y_root]
+
+
+def offline_dynamic_connectivity(n, queries):
+    """
+    辺の追加・削除と連結判定のクエリ列を、まとめて処理する
+    
+    queries[t] = (p, x, y) で、
+    - p=0: 辺(x, y)を追加する
+    - p=1: 辺(x, y)を削除する（その時点で存在する辺であること）
+    - p=2: xとyが連結かどうか（1: 連結、0: 非連結）
+    p=2 のクエリの結果を順に並べたリストを返す。
+    
+    各辺が存在する時間の区間[追加, 削除)を、時間を添字とするセグメント木の
+    O(log Q) 個のノードに載せる。木を根から深さ優先でたどり、ノードに入るときに
+    その辺を unite し、出るときに rollback すると、葉 t に着いたときには
+    ちょうど時刻 t に存在する辺だけが併合されている。
+    全体で O(Q log Q log N)。
+    """
+    q = len(queries)
+    size = 1
+    while size < q:
+        size *= 2
+    edges_at = [[] for _ in range(2 * size)]
+    
+    def add_interval(a, b, edge):
+        # 区間[a, b)をちょうど覆うノードに辺を載せる
+        a += size
+        b += size
+        while a < b:
+            if a & 1:
+                edges_at[a].append(edge)
+                a += 1
+            if b & 1:
+                b -= 1
+                edges_at[b].append(edge)
+            a >>= 1
+            b >>= 1
+    
+    # 各辺が追加された時刻を覚えておき、削除されたら区間を確定する
+    added = {}
+    for t, (p, x, y) in enumerate(queries):
+        edge = (min(x, y), max(x, y))
+        if p == 0:
+            added.setdefault(edge, []).append(t)
+        elif p == 1:
+            add_interval(added[edge].pop(), t, edge)
+    # 最後まで削除されなかった辺
+    for edge, times in added.items():
+        for t in times:
+            add_interval(t, q, edge)
+    
+    uf = RollbackUnionFind(n)
+    answers = []
+    # 再帰の代わりにスタックでたどる（負の番号はノードから出る処理を表す）
+    stack = [1]
+    states = [0] * (2 * size)
+    while stack:
+        node = stack.pop()
+        if node < 0:
+            uf.rollback(states[-node])
+            continue
+        states[node] = uf.snapshot()
+        for x, y in edges_at[node]:
+            uf.unite(x, y)
+        stack.append(-node)
+        if node >= size:
+            t = node - size
+            if t < q and queries[t][0] == 2:
+                _, x, y = queries[t]
+                answers.append(1 if uf.same(x, y) else 0)
+        else:
+            # 時刻の小さい左の子から先に処理する
+            stack.append(2 * node + 1)
+            stack.append(2 * node)
+    return answers
+
+
+def kruskal(n, us, vs, ws):
+    """
+    クラスカル法で最小全域木（非連結なら最小全域森）を求める
+    
+    辺 i は頂点 us[i] と vs[i] を結ぶ重み ws[i] の無向辺。
+    (重みの合計, 採用した辺の番号のリスト) を返す。
+    
+    辺を (重み, 端点, 端点) のタプルのリストにして並べ替える代わりに、
+    重みの列だけを np.argsort で並べ替えて辺の順番を決める。
+    n-1 本採用した（全体が1つにつながった）時点で打ち切る。
+    """
+    import numpy as np
+    us = np.asarray(us)
+    vs = np.asarray(vs)
+    ws = np.asarray(ws)
+    order = np.argsort(ws, kind='stable')
+    
+    uf = UnionFind(n, by_size=True)
+    find = uf.find
+    total = 0
+    chosen = []
+    for i, u, v, w in zip(order.tolist(), us[order].tolist(), vs[order].tolist(), ws[order].tolist()):
+        if uf.count == 1:
+            break
+        u_root = find(u)
+        v_root = find(v)
+        if u_root != v_root:
+            uf.unite(u_root, v_root)
+            total += w
+            chosen.append(i)
+    return total, chosen
+
+
+def find_many(parent, xs):
+    """
+    NumPy配列で持った親の配列に対して、複数の要素の根をまとめて求める
+    
+    全要素を同時に1段ずつ根へ進めながら、通った要素の親を祖父に
+    付け替える（経路半減）ので、繰り返すほど木が浅くなる。
+    """
+    r = xs
+    while True:
+        p = parent[r]
+        gp = parent[p]
+        if (p == gp).all():
+            return p
+        parent[r] = gp
+        r = gp
+
+
+def unite_many(parent, us, vs):
+    """
+    NumPy配列で持った親の配列に対して、複数の辺(us[i], vs[i])をまとめて併合する
+    
+    すべての辺の両端の根を求め、番号の大きい根を小さい根につなぐ（フッキング）。
+    同じ根からつなぐ先の候補が複数あるときは、np.minimum.at で一番小さい
+    ものを選ぶので、候補がいくつあっても1回でつながる（中心の番号が大きい
+    星形のグラフでも、繰り返しは数回で済む）。根が異なる辺がなくなるまで
+    繰り返す。つなぐ先は常に番号の小さい方なので閉路はできず、
+    各集合の根はその集合で一番小さい要素になる。
+    """
+    import numpy as np
+    while len(us):
+        us = find_many(parent, us)
+        vs = find_many(parent, vs)
+        # まだ別の集合にある辺だけを残す
+        differ = us != vs
+        us = us[differ]
+        vs = vs[differ]
+        np.minimum.at(parent, np.maximum(us, vs), np.minimum(us, vs))
+
+
+# process_batch で、これ以上同じ種類のクエリが続く区間だけを NumPy でまとめて処理する
+BATCH_MIN_RUN = 1 << 10
+
+
+def _process_serial(parent, ops, xs, ys):
+    """
+    process_batch の短い区間用に、リストで持った親の配列に対してクエリを1つずつ処理する
+    
+    unite_many と同じく、番号の大きい根を小さい根につなぐ。
+    各クエリの same の結果（unite の位置は0）を並べたリストを返す。
+    """
+    result = [0] * len(ops)
+    for j in range(len(ops)):
+        x = xs[j]
+        y = ys[j]
+        # 経路半減: たどりながら親を祖父に付け替える
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        while parent[y] != y:
+            parent[y] = parent[parent[y]]
+            y = parent[y]
+        if ops[j] == 0:
+            if x < y:
+                parent[y] = x
+            elif y < x:
+                parent[x] = y
+        elif x == y:
+            result[j] = 1
+    return result
+
+
+def process_batch(n, ops, xs, ys):
+    """
+    unite / same のクエリ列をNumPy配列で受け取り、まとめて処理する
+    
+    ops[j] が0なら unite(xs[j], ys[j])、1なら same(xs[j], ys[j]) を表す。
+    same の結果（1: 同じ集合、0: 異なる集合）をクエリの順に並べた配列を返す。
+    
+    同じ種類のクエリが長く続く区間は、以下をまとめて行う：
+    - unite: unite_many で辺をまとめて併合する
+    - same: 両端の根をまとめて求めて比較する
+    種類が細かく入れ替わる部分は、区間ごとに NumPy を呼ぶと呼び出しの手間の方が
+    大きくなるので、リストの親の配列で1つずつ処理する（_process_serial）。
+    どちらも根を集合で一番小さい要素にそろえるので、親の配列を
+    リストと NumPy 配列の間で変換するだけで行き来できる。
+    """
+    import numpy as np
+    ops = np.asarray(ops, dtype=np.int64)
+    xs = np.asarray(xs, dtype=np.int64)
+    ys = np.asarray(ys, dtype=np.int64)
+    q = len(ops)
+    result = np.zeros(q, dtype=np.int64)
+    
+    # NumPy でまとめて処理する区間を選ぶ。親の配列の変換に O(N) かかるので、
+    # N が大きいほど長い区間でないと元が取れない
+    min_run = max(BATCH_MIN_RUN, n // 16)
+    starts = np.flatnonzero(np.r_[True, ops[1:] != ops[:-1]]) if q else np.zeros(0, dtype=np.int64)
+    ends = np.r_[starts[1:], q]
+    long = ends - starts >= min_run
+    runs = list(zip(starts[long].tolist(), ends[long].tolist())) + [(q, q)]
+    
+    parent = list(range(n))
+    done = 0
+    for s, e in runs:
+        # 長い区間の手前までは1つずつ処理する
+        if done < s:
+            if not isinstance(parent, list):
+                parent = parent.tolist()
+            result[done:s] = _process_serial(parent, ops[done:s].tolist(),
+                                             xs[done:s].tolist(), ys[done:s].tolist())
+        if s < e:
+            if isinstance(parent, list):
+                parent = np.array(parent, dtype=np.int64)
+            if ops[s] == 0:
+                unite_many(parent, xs[s:e], ys[s:e])
+            else:
+                result[s:e] = find_many(parent, xs[s:e]) == find_many(parent, ys[s:e])
+        done = e
+    return result[ops == 1]
+
+
+def write_edge_file(path, us, vs):
+    """辺の列を、int32 の (u, v) を並べたバイナリファイルに書き出す"""
+    import numpy as np
+    np.column_stack((us, vs)).astype(np.int32).tofile(path)
+
+
+def _shard_components(args):
+    """
+    辺ファイルの一部[start, end)だけで連結成分を求め、
+    (要素, その成分の代表元) の組のうち要素自身が代表元でないものを返す
+    """
+    import numpy as np
+    path, n, start, end = args
+    edges = np.memmap(path, dtype=np.int32, mode='r').reshape(-1, 2)[start:end]
+    parent = np.arange(n, dtype=np.int64)
+    unite_many(parent, edges[:, 0].astype(np.int64), edges[:, 1].astype(np.int64))
+    labels = find_many(parent, np.arange(n, dtype=np.int64))
+    moved = np.flatnonzero(labels != np.arange(n))
+    return moved, labels[moved]
+
+
+def connected_components_parallel(n, path, workers=None):
+    """
+    巨大な辺ファイル（write_edge_file の形式）から連結成分を複数プロセスで求める
+    
+    各要素の属する成分の代表元を並べた配列を返す。代表元はその成分で
+    一番小さい要素にそろえてある（UnionFind.find の根とは選び方が違うが、
+    同じ成分かどうかの分け方は一致する）。
+    
+    1. 辺ファイルをメモリマップで開き、プロセスごとに担当範囲を分ける
+    2. 各プロセスは担当範囲の辺だけで連結成分を求め、
+       「要素 → 代表元」の辺（高々 N-1 本）にまとめて返す
+    3. 全プロセスの「要素 → 代表元」の辺を併合して、全体の連結成分にする
+    辺そのものはプロセス間で受け渡さないので、辺の本数が多くても
+    やり取りするのは1プロセスあたり O(N) で済む。
+    """
+    import numpy as np
+    m = os.path.getsize(path) // 8
+    # 辺が1本もないファイルはメモリマップで開けないので、ここで答える
+    if m == 0:
+        return np.arange(n, dtype=np.int64)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    bounds = [m * k // workers for k in range(workers + 1)]
+    tasks = [(path, n, bounds[k], bounds[k + 1]) for k in range(workers)]
+    
+    with Pool(workers) as pool:
+        shards = pool.map(_shard_components, tasks)
+    
+    # 各プロセスの結果を、もう一度まとめて併合する
+    parent = np.arange(n, dtype=np.int64)
+    for us, vs in shards:
+        unite_many(parent, us, vs)
+    return find_many(parent, np.arange(n, dtype=np.int64))
 
 
 def solve():
@@ -101,6 +578,19 @@ def solve():
             print(1 if uf.same(x, y) else 0)
 
 
+def solve_batch():
+    """
+    solve() と同じ入力を、process_batch でまとめて処理する版
+    """
+    import numpy as np
+    data = np.array(sys.stdin.buffer.read().split(), dtype=np.int64)
+    N, Q = int(data[0]), int(data[1])
+    queries = data[2:2 + 3 * Q].reshape(Q, 3)
+    answers = process_batch(N, queries[:, 0], queries[:, 1], queries[:, 2])
+    if len(answers):
+        print("\n".join(map(str, answers.tolist())))
+
+
 if __name__ == "__main__":
     solve()
 """
@@ -44,12 +44,651 @@ N個の頂点とM本の有向辺からなるグラフがあります。
 """
 
 import heapq
+from multiprocessing import Pool
+import numbers
+import os
+import tempfile
 
 def mysolution():
     # 実装を試みてください
     pass
 
-"""
+# 到達できない頂点の距離を表す番兵（float('inf') の代わりに整数を使う）
+INF = (1 << 63) - 1
+
+class CSRGraph:
+    """
+    CSR（圧縮行格納）形式の有向グラフ
+    
+    graph = [[] for _ in range(N)] に辺のタプルを append していく隣接リストは、
+    1辺あたり100バイト以上を使う。CSR形式では全頂点の隣接頂点を1本の配列 adj に
+    頂点番号順に詰めて並べ、頂点uの隣接頂点を adj[indptr[u]:indptr[u+1]] とする。
+    1辺あたり 4(+8) バイトで済む。
+    
+    - neighbors(u) / weights(u): 頂点uの隣接頂点・辺の重み（コピーしない配列）
+    - graph[u]: 頂点uの隣接頂点のリスト（隣接リストと同じように使える）
+    - reverse(): すべての辺の向きを逆にしたグラフ
+    """
+    def __init__(self, n, us, vs, ws=None):
+        """辺 i が us[i] → vs[i]（重み ws[i]）のグラフを作る"""
+        import numpy as np
+        us = np.asarray(us, dtype=np.int64)
+        vs = np.asarray(vs, dtype=np.int64)
+        self.n = n
+        
+        # 各頂点から出る辺の本数を数え、その累積和を各頂点の辺の開始位置にする
+        counts = np.bincount(us, minlength=n)
+        self.indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(counts, out=self.indptr[1:])
+        # 始点の番号で安定に並べ替えると、各頂点の辺が開始位置から順に並ぶ
+        order = np.argsort(us, kind='stable')
+        self.adj = vs[order].astype(np.int32)
+        if ws is None:
+            self.weight = None
+        else:
+            # 整数の重みは int64 にそろえ、小数の重みは切り捨てずにそのまま持つ
+            ws = np.asarray(ws)
+            if ws.dtype.kind in 'iub':
+                ws = ws.astype(np.int64)
+            self.weight = ws[order]
+        self._reverse = None
+        self._max_weight = -1  # max_edge_weight の結果（-1 はまだ求めていない）
+    
+    @classmethod
+    def from_arrays(cls, indptr, adj, weight=None):
+        """作成済みの indptr / adj / weight の配列をそのまま使ってグラフにする（コピーしない）"""
+        graph = cls.__new__(cls)
+        graph.n = len(indptr) - 1
+        graph.indptr = indptr
+        graph.adj = adj
+        graph.weight = weight
+        graph._reverse = None
+        graph._max_weight = -1
+        return graph
+    
+    @classmethod
+    def from_adjacency(cls, graph):
+        """隣接リスト graph[u] = [(v, cost), ...] から作る"""
+        import numpy as np
+        n = len(graph)
+        us = np.repeat(np.arange(n), [len(edges) for edges in graph])
+        vs = [v for edges in graph for v, _ in edges]
+        ws = [cost for edges in graph for _, cost in edges]
+        return cls(n, us, vs, ws)
+    
+    @classmethod
+    def from_file(cls, path, n, weighted=False, dtype='int32'):
+        """(u, v) または (u, v, w) を dtype で並べたバイナリファイルから読み込む"""
+        import numpy as np
+        # 辺が1本もないファイルはメモリマップで開けないので、辺のないグラフにする
+        if os.path.getsize(path) == 0:
+            empty = np.zeros(0, dtype=dtype)
+            return cls(n, empty, empty, empty if weighted else None)
+        edges = np.memmap(path, dtype=dtype, mode='r').reshape(-1, 3 if weighted else 2)
+        return cls(n, edges[:, 0], edges[:, 1], edges[:, 2] if weighted else None)
+    
+    def __len__(self):
+        return self.n
+    
+    def __getitem__(self, u):
+        return self.neighbors(u).tolist()
+    
+    def neighbors(self, u):
+        """頂点uの隣接頂点の配列"""
+        return self.adj[self.indptr[u]:self.indptr[u + 1]]
+    
+    def weights(self, u):
+        """頂点uから出る辺の重みの配列（neighbors(u) と同じ順）"""
+        return self.weight[self.indptr[u]:self.indptr[u + 1]]
+    
+    def edges(self, u):
+        """頂点uから出る辺の (隣接頂点, 重み) を順に返す"""
+        a, b = self.indptr[u], self.indptr[u + 1]
+        return zip(self.adj[a:b].tolist(), self.weight[a:b].tolist())
+    
+    def reverse(self):
+        """すべての辺の向きを逆にしたグラフ（一度作ったら使い回す）"""
+        import numpy as np
+        if self._reverse is None:
+            sources = np.repeat(np.arange(self.n), np.diff(self.indptr))
+            self._reverse = CSRGraph(self.n, self.adj, sources, self.weight)
+            self._reverse._reverse = self
+        return self._reverse
+
+# 辺の重みの最大値がこれ以下ならバケットキュー（Dial法）、
+# RADIX_MAX_WEIGHT 以下なら基数ヒープを使う
+# （それより大きいと、Pythonでは heapq の方が速かった）
+BUCKET_MAX_WEIGHT = 100
+RADIX_MAX_WEIGHT = 10 ** 5
+
+def dijkstra(graph, sources, goal=None, want_path=False, queue='heap'):
+    """
+    ダイクストラ法で始点からの最短距離を求める
+    
+    Parameters:
+    - graph: 隣接リスト graph[u] = [(v, cost), ...]、または重み付きの CSRGraph
+      （cost は0以上）
+    - sources: 始点（頂点番号、または複数の始点のリスト）
+    - goal: 指定すると、goal の距離が確定した時点で探索を打ち切る
+    - want_path: True なら経路復元用の直前の頂点の配列も返す
+    - queue: 未確定の頂点を管理するキューの種類
+      'heap': 二分ヒープ（heapq）
+      'bucket': 距離ごとのバケット（Dial法）。重みが小さい整数のとき速い
+      'radix': 基数ヒープ。重みが整数のとき使える
+      'indexed': 値の減少（decrease-key）ができる二分ヒープ（IndexedHeap）。
+                 ヒープの大きさが頂点数以下に収まる
+      'auto': 重みがすべて整数で最大値が BUCKET_MAX_WEIGHT 以下なら 'bucket'、
+              RADIX_MAX_WEIGHT 以下なら 'radix'、それ以外は 'heap'
+              （重みを調べるのに O(M) かかるので、goal で早く打ち切れる探索では
+              'heap' の方が速いことがある。CSRGraph では2回目から O(1)）
+    
+    Returns:
+    - dist: 各頂点への最短距離（到達できない頂点は INF）
+      goal を指定した場合、確定しているのは距離が dist[goal] 以下の頂点だけ
+    - prev: want_path=True のとき、最短経路での直前の頂点（始点と未到達は -1）
+    """
+    n = len(graph)
+    # NumPy の整数（np.int64 など）も1つの始点として扱う
+    if isinstance(sources, numbers.Integral):
+        sources = [sources]
+    if isinstance(graph, CSRGraph):
+        if graph.weight is None:
+            raise ValueError("dijkstra には重み付きの CSRGraph を渡してください（重みなしなら 09_幅優先探索.py の bfs を使う）")
+        adjacent = graph.edges
+    else:
+        adjacent = graph.__getitem__
+    
+    max_weight = None
+    if queue in ('auto', 'bucket', 'radix'):
+        # 'auto' で調べた重みの最大値を、'bucket' のバケットの数にもそのまま使う
+        max_weight = max_edge_weight(graph)
+        if queue == 'auto':
+            queue = choose_queue(max_weight)
+        elif max_weight is None:
+            raise ValueError(f"queue='{queue}' は辺の重みがすべて整数のときだけ使えます")
+    
+    # 最短距離の初期化
+    dist = [INF] * n
+    prev = [-1] * n
+    for s in sources:
+        dist[s] = 0
+    
+    if queue == 'bucket':
+        _bucket_search(adjacent, dist, prev, sources, goal, max_weight)
+    elif queue == 'radix':
+        _radix_search(adjacent, dist, prev, sources, goal)
+    elif queue == 'indexed':
+        _indexed_search(adjacent, dist, prev, sources, goal)
+    else:
+        _heap_search(adjacent, dist, prev, sources, goal)
+    
+    if want_path:
+        return dist, prev
+    return dist
+
+def max_edge_weight(graph):
+    """
+    辺の重みがすべて整数ならその最大値（辺がなければ0）、整数でない重みがあれば None
+    
+    CSRGraph では一度求めた値を覚えておく。
+    """
+    if isinstance(graph, CSRGraph):
+        if graph._max_weight == -1:
+            weight = graph.weight
+            if len(weight) == 0:
+                graph._max_weight = 0
+            elif weight.dtype.kind in 'iub':
+                graph._max_weight = int(weight.max())
+            else:
+                graph._max_weight = None
+        return graph._max_weight
+    max_weight = 0
+    for edges in graph:
+        for _, cost in edges:
+            if not isinstance(cost, numbers.Integral):
+                return None
+            if cost > max_weight:
+                max_weight = cost
+    return max_weight
+
+def choose_queue(max_weight):
+    """max_edge_weight で求めた値から、dijkstra の queue='auto' で使うキューの種類を決める"""
+    if max_weight is not None:
+        if max_weight <= BUCKET_MAX_WEIGHT:
+            return 'bucket'
+        if max_weight <= RADIX_MAX_WEIGHT:
+            return 'radix'
+    return 'heap'
+
+def _heap_search(adjacent, dist, prev, sources, goal):
+    """二分ヒープを使ったダイクストラ法の本体"""
+    # 優先度キュー（最小ヒープ）の初期化
+    priority_queue = [(0, s) for s in sources]  # (距離, 頂点)
+    heapq.heapify(priority_queue)
+    
+    while priority_queue:
+        # 未確定の頂点の中で最短の頂点を取り出す
+        current_dist, current = heapq.heappop(priority_queue)
+        
+        # 既に処理された頂点は飛ばす
+        if current_dist > dist[current]:
+            continue
+        
+        # ゴールの距離が確定したら、残りの頂点は調べなくてよい
+        if current == goal:
+            break
+        
+        # 隣接する頂点を調べる
+        for next_node, cost in adjacent(current):
+            # より短い経路が見つかった場合は更新
+            new_dist = current_dist + cost
+            if dist[next_node] > new_dist:
+                dist[next_node] = new_dist
+                prev[next_node] = current
+                heapq.heappush(priority_queue, (new_dist, next_node))
+
+class IndexedHeap:
+    """
+    値の減少（decrease-key）ができる二分ヒープ
+    
+    heapq で (距離, 頂点) を push していくと、同じ頂点の古い組がヒープに残り、
+    密なグラフではヒープの大きさが辺の数 O(M) まで膨らむ。
+    このヒープは頂点ごとに「ヒープ内の位置」を覚えておき、
+    既にある頂点の値を小さくするときはその場で上に移動させるので、
+    大きさは常に頂点数 O(N) 以下になり、タプルも作らない。
+    
+    - heap[i]: ヒープのi番目の頂点
+    - pos[v]: 頂点vのヒープ内の位置（ヒープにないなら -1）
+    - key[v]: 頂点vの値
+    """
+    def __init__(self, n):
+        self.heap = []
+        self.pos = [-1] * n
+        self.key = [0] * n
+    
+    def __len__(self):
+        return len(self.heap)
+    
+    def push(self, v, k):
+        """頂点vを値kで追加する（既にあれば値をkに減らす）"""
+        if self.pos[v] == -1:
+            self.pos[v] = len(self.heap)
+            self.heap.append(v)
+        self.key[v] = k
+        self._sift_up(self.pos[v])
+    
+    def pop(self):
+        """値が最小の頂点を取り出す"""
+        heap = self.heap
+        top = heap[0]
+        self.pos[top] = -1
+        last = heap.pop()
+        if heap:
+            heap[0] = last
+            self.pos[last] = 0
+            self._sift_down(0)
+        return top
+    
+    def _sift_up(self, i):
+        """位置iの頂点を、親より値が小さい間上に移動させる"""
+        heap, pos, key = self.heap, self.pos, self.key
+        v = heap[i]
+        k = key[v]
+        while i > 0:
+            parent = (i - 1) >> 1
+            u = heap[parent]
+            if key[u] <= k:
+                break
+            heap[i] = u
+            pos[u] = i
+            i = parent
+        heap[i] = v
+        pos[v] = i
+    
+    def _sift_down(self, i):
+        """位置iの頂点を、子より値が大きい間下に移動させる"""
+        heap, pos, key = self.heap, self.pos, self.key
+        n = len(heap)
+        v = heap[i]
+        k = key[v]
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            if child + 1 < n and key[heap[child + 1]] < key[heap[child]]:
+                child += 1
+            u = heap[child]
+            if k <= key[u]:
+                break
+            heap[i] = u
+            pos[u] = i
+            i = child
+        heap[i] = v
+        pos[v] = i
+
+def _indexed_search(adjacent, dist, prev, sources, goal):
+    """値の減少ができる二分ヒープを使ったダイクストラ法の本体"""
+    queue = IndexedHeap(len(dist))
+    for s in sources:
+        queue.push(s, 0)
+    
+    while queue:
+        # 同じ頂点が2回入ることはないので、取り出した頂点の距離は確定している
+        current = queue.pop()
+        if current == goal:
+            return
+        current_dist = dist[current]
+        for next_node, cost in adjacent(current):
+            new_dist = current_dist + cost
+            if dist[next_node] > new_dist:
+                dist[next_node] = new_dist
+                prev[next_node] = current
+                queue.push(next_node, new_dist)
+
+def _bucket_search(adjacent, dist, prev, sources, goal, max_weight):
+    """
+    バケットキュー（Dial法）を使ったダイクストラ法の本体
+    
+    未確定の頂点の距離は常に [d, d + C] （d は現在の距離、C は重みの最大値）の
+    範囲にあるので、C+1 個のバケットを輪状に使い回し、距離 d の頂点を
+    buckets[d % (C+1)] に入れる。d を1ずつ増やしながらバケットを空にしていくので、
+    ヒープのような比較も (距離, 頂点) のタプルも要らない。
+    """
+    size = max_weight + 1
+    buckets = [[] for _ in range(size)]
+    buckets[0] = list(sources)
+    remaining = len(sources)  # バケットに入っている頂点の数
+    
+    d = 0
+    while remaining:
+        bucket = buckets[d % size]
+        while bucket:
+            current = bucket.pop()
+            remaining -= 1
+            # 後からより短い距離が見つかった頂点は飛ばす
+            if dist[current] != d:
+                continue
+            if current == goal:
+                return
+            for next_node, cost in adjacent(current):
+                new_dist = d + cost
+                if dist[next_node] > new_dist:
+                    dist[next_node] = new_dist
+                    prev[next_node] = current
+                    buckets[new_dist % size].append(next_node)
+                    remaining += 1
+        d += 1
+
+def _radix_search(adjacent, dist, prev, sources, goal):
+    """
+    基数ヒープを使ったダイクストラ法の本体
+    
+    ダイクストラ法では取り出す距離が単調に増えることを利用する。
+    最後に取り出した距離 last と xor を取ったときの最上位ビットの位置で
+    バケットを分け、バケット0が空になったら、空でない最小のバケットの中身を
+    最小値を新しい last として配り直す。各要素が配り直される回数は
+    ビット数以下なので、重みの大きさによらず使える。
+    """
+    buckets = [[] for _ in range(65)]
+    buckets[0] = [(0, s) for s in sources]
+    remaining = len(sources)
+    last = 0
+    
+    while remaining:
+        if not buckets[0]:
+            i = 1
+            while not buckets[i]:
+                i += 1
+            items = buckets[i]
+            buckets[i] = []
+            last = min(items)[0]
+            for item in items:
+                buckets[(item[0] ^ last).bit_length()].append(item)
+        
+        current_dist, current = buckets[0].pop()
+        remaining -= 1
+        if current_dist > dist[current]:
+            continue
+        if current == goal:
+            return
+        for next_node, cost in adjacent(current):
+            new_dist = current_dist + cost
+            if dist[next_node] > new_dist:
+                dist[next_node] = new_dist
+                prev[next_node] = current
+                buckets[(new_dist ^ last).bit_length()].append((new_dist, next_node))
+                remaining += 1
+
+def restore_path(prev, goal):
+    """dijkstra が返した prev から、始点から goal までの頂点の列を復元する"""
+    path = []
+    while goal != -1:
+        path.append(goal)
+        goal = prev[goal]
+    path.reverse()
+    return path
+
+def reverse_graph(graph):
+    """隣接リスト graph[u] = [(v, cost), ...] のすべての辺の向きを逆にする"""
+    if isinstance(graph, CSRGraph):
+        return graph.reverse()
+    reversed_graph = [[] for _ in range(len(graph))]
+    for u, edges in enumerate(graph):
+        for v, cost in edges:
+            reversed_graph[v].append((u, cost))
+    return reversed_graph
+
+def bidirectional_dijkstra(graph, start, goal, reversed_graph=None):
+    """
+    双方向ダイクストラ法で start から goal までの最短距離を求める（到達できなければ INF）
+    
+    start からの探索（順方向）と、辺を逆向きにしたグラフでの goal からの探索
+    （逆方向）を1頂点ずつ交互に進める。片方の探索で調べた辺の先が
+    もう片方の探索で到達済みなら、その2つをつないだ経路の長さで
+    暫定の最短距離 mu を更新する。
+    両方のヒープの先頭の距離の和が mu 以上になったら、それより短い経路は
+    もう見つからないので終了する。
+    start の周りを大きく広げる通常の探索に比べ、2つの小さな範囲を調べるだけで済む。
+    
+    同じグラフに何度も問い合わせる場合は、reverse_graph(graph) で作った
+    逆向きのグラフを reversed_graph に渡すと作り直さずに済む。
+    """
+    if start == goal:
+        return 0
+    if reversed_graph is None:
+        reversed_graph = reverse_graph(graph)
+    adjacent = []
+    for g in (graph, reversed_graph):
+        adjacent.append(g.edges if isinstance(g, CSRGraph) else g.__getitem__)
+    
+    n = len(graph)
+    dist = [[INF] * n, [INF] * n]  # dist[0]: start から、dist[1]: goal まで
+    dist[0][start] = 0
+    dist[1][goal] = 0
+    queues = [[(0, start)], [(0, goal)]]
+    mu = INF
+    
+    side = 0
+    while queues[0] and queues[1]:
+        # どちらの探索でも、これより短い経路は見つからない
+        if queues[0][0][0] + queues[1][0][0] >= mu:
+            break
+        
+        current_dist, current = heapq.heappop(queues[side])
+        my_dist = dist[side]
+        other_dist = dist[1 - side]
+        if current_dist <= my_dist[current]:
+            for next_node, cost in adjacent[side](current):
+                new_dist = current_dist + cost
+                if my_dist[next_node] > new_dist:
+                    my_dist[next_node] = new_dist
+                    heapq.heappush(queues[side], (new_dist, next_node))
+                # もう片方の探索とつながったら、暫定の最短距離を更新
+                if other_dist[next_node] != INF and new_dist + other_dist[next_node] < mu:
+                    mu = new_dist + other_dist[next_node]
+        
+        # 順方向と逆方向を交互に進める
+        side ^= 1
+    
+    return mu
+
+# 辺の数がこれ × N^2 未満の疎なグラフでは、全点対最短経路に Johnson 法を使う
+JOHNSON_MAX_DENSITY = 1 / 256
+
+def floyd_warshall(n, us, vs, ws):
+    """
+    ワーシャルフロイド法で全点対の最短距離を求める（O(N^3)）
+    
+    辺 i は us[i] → vs[i]（重み ws[i]、負でもよい）。
+    距離の表 D を NumPy の2次元配列で持ち、経由する頂点 k ごとに
+    D = minimum(D, D[:, k] + D[k, :]) を表全体に一度に行う。
+    Pythonのループは N 回だけで済む。
+    到達できない組は INF（重みに小数があれば float の表で、np.inf）。
+    負の閉路があれば ValueError を送出する。
+    """
+    import numpy as np
+    # 到達できない組を np.inf で表すため、途中は浮動小数点数で計算する
+    dist = np.full((n, n), np.inf)
+    us = np.asarray(us, dtype=np.int64)
+    vs = np.asarray(vs, dtype=np.int64)
+    ws = np.asarray(ws)
+    np.minimum.at(dist, (us, vs), ws.astype(np.float64))
+    np.fill_diagonal(dist, np.minimum(dist.diagonal(), 0))
+    
+    for k in range(n):
+        np.minimum(dist, dist[:, k, None] + dist[k], out=dist)
+    
+    if (dist.diagonal() < 0).any():
+        raise ValueError("グラフに負の閉路が存在します。")
+    # 小数の重みなら、計算した float の表をそのまま返す
+    if len(ws) and ws.dtype.kind not in 'iub':
+        return dist
+    result = np.full((n, n), INF, dtype=np.int64)
+    reachable = np.isfinite(dist)
+    result[reachable] = dist[reachable]
+    return result
+
+def johnson(n, us, vs, ws):
+    """
+    Johnson法で全点対の最短距離を求める（O(NM log N)）
+    
+    負の重みの辺があるとダイクストラ法は使えないので、まずベルマンフォード法で
+    ポテンシャル h を求め、辺の重みを w + h[u] - h[v]（0以上になる）に付け替える。
+    その後、各頂点からダイクストラ法を行い、h の分を戻す。
+    疎なグラフではワーシャルフロイド法より速い。
+    到達できない組は INF（重みに小数があれば float の表で、np.inf）。
+    負の閉路があれば ValueError を送出する。
+    """
+    import numpy as np
+    us = np.asarray(us, dtype=np.int64)
+    vs = np.asarray(vs, dtype=np.int64)
+    ws = np.asarray(ws)
+    # 整数の重みなら int64 で、小数の重みなら float64 で計算する（切り捨てない）
+    integral = len(ws) == 0 or ws.dtype.kind in 'iub'
+    ws = ws.astype(np.int64 if integral else np.float64)
+    unreachable = INF if integral else np.inf
+    # 頂点がなければ下のループが1回も回らず、負の閉路と判定されてしまう
+    if n == 0:
+        return np.zeros((0, 0), dtype=ws.dtype)
+    
+    # ベルマンフォード法（全頂点に重み0の辺を張った仮想の始点から）
+    # 辺の緩和は全辺を一度に行い、変化がなくなるまで繰り返す
+    h = np.zeros(n, dtype=ws.dtype)
+    for _ in range(n):
+        new_h = h.copy()
+        np.minimum.at(new_h, vs, h[us] + ws)
+        if (new_h == h).all():
+            break
+        h = new_h
+    else:
+        raise ValueError("グラフに負の閉路が存在します。")
+    
+    reweighted = ws + h[us] - h[vs]
+    if not integral:
+        # 小数の計算誤差でわずかに負になった重みを0に直す
+        reweighted = np.maximum(reweighted, 0)
+    graph = CSRGraph(n, us, vs, reweighted)
+    result = np.full((n, n), unreachable, dtype=ws.dtype)
+    for s in range(n):
+        # 重みの最大値は graph が覚えておくので、調べるのは最初の1回だけで済む
+        dist = dijkstra(graph, s, queue='auto')
+        if integral:
+            row = np.array(dist, dtype=np.int64)
+        else:
+            row = np.array([np.inf if d == INF else d for d in dist])
+        reachable = row != unreachable
+        result[s, reachable] = row[reachable] - h[s] + h[reachable]
+    return result
+
+def all_pairs_shortest_paths(n, us, vs, ws, engine='auto'):
+    """
+    全点対の最短距離を求める
+    
+    engine は 'floyd'（ワーシャルフロイド法）か 'johnson'（Johnson法）。
+    'auto' なら、辺の数が JOHNSON_MAX_DENSITY × N^2 未満の疎なグラフで
+    'johnson'、それ以外で 'floyd' を使う。
+    """
+    if engine == 'auto':
+        engine = 'johnson' if len(us) < JOHNSON_MAX_DENSITY * n * n else 'floyd'
+    if engine == 'johnson':
+        return johnson(n, us, vs, ws)
+    return floyd_warshall(n, us, vs, ws)
+
+# 各ワーカープロセスが読み込んだグラフと、使うキューの種類
+_worker_state = {}
+
+def _load_worker_graph(directory, queue):
+    """ワーカープロセスの初期化：保存されたCSR配列をメモリマップで開く"""
+    import numpy as np
+    arrays = [np.load(os.path.join(directory, name + '.npy'), mmap_mode='r')
+              for name in ('indptr', 'adj', 'weight')]
+    _worker_state['graph'] = CSRGraph.from_arrays(*arrays)
+    _worker_state['queue'] = queue
+
+def _shortest_path_row(source):
+    """ワーカープロセスで1つの始点からの最短距離を求める"""
+    import numpy as np
+    graph = _worker_state['graph']
+    dist = dijkstra(graph, source, queue=_worker_state['queue'])
+    if graph.weight.dtype.kind == 'f':
+        # 小数の重みなら float の配列にし、到達できない頂点は np.inf で表す
+        return source, np.array([np.inf if d == INF else d for d in dist])
+    return source, np.array(dist, dtype=np.int64)
+
+def shortest_paths_from(graph, sources, workers=None, queue='auto'):
+    """
+    多数の始点それぞれからの最短距離を、複数プロセスで並列に求める
+    
+    (始点, その始点からの距離の配列) を、計算が終わったものから順に返すジェネレータを返す。
+    距離の表全体を一度にメモリに持たなくてよい（返ってくる順番は始点の順とは限らない）。
+    sources には np.arange(k) のような NumPy の整数の配列も渡せる。
+    
+    グラフはCSR形式にして一時ファイルに保存し、各ワーカープロセスは
+    それをメモリマップで読み取り専用に開く。グラフをプロセスごとに
+    コピーして送らずに済み、ページはOSのキャッシュで共有される。
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_adjacency(graph)
+    if graph.weight is None:
+        raise ValueError("shortest_paths_from には重み付きの CSRGraph を渡してください")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    # キューの種類は先に決めておき、各プロセスで重みを調べ直さないようにする
+    if queue == 'auto':
+        queue = choose_queue(max_edge_weight(graph))
+    # 引数の確認と変換はここで済ませ、計算は返したジェネレータを回したときに始まる
+    return _shortest_paths_generator(graph, sources, workers, queue)
+
+def _shortest_paths_generator(graph, sources, workers, queue):
+    """shortest_paths_from の本体：グラフを保存してワーカープロセスに各始点を割り振る"""
+    import numpy as np
+    with tempfile.TemporaryDirectory() as directory:
+        for name in ('indptr', 'adj', 'weight'):
+            np.save(os.path.join(directory, name + '.npy'), getattr(graph, name))
+        with Pool(workers, initializer=_load_worker_graph, initargs=(directory, queue)) as pool:
+            # NumPy の整数はPythonの整数に直してから各プロセスに送る
+            yield from pool.imap_unordered(_shortest_path_row, (int(s) for s in sources))
+
 def solve():
     # 入力を受け取る
     N, M = map(int, input().split())
@@ -60,38 +699,10 @@ def solve():
         a, b, c = map(int, input().split())
         graph[a].append((b, c))  # 頂点aから頂点bへのコストcの辺
     
-    # ダイクストラ法で最短経路を求める
-    def dijkstra(start, goal):
-        # 最短距離の初期化
-        dist = [float('inf')] * (N + 1)
-        dist[start] = 0
-        
-        # 優先度キュー（最小ヒープ）の初期化
-        priority_queue = [(0, start)]  # (距離, 頂点)
-        
-        while priority_queue:
-            # 未確定の頂点の中で最短の頂点を取り出す
-            current_dist, current = heapq.heappop(priority_queue)
-            
-            # 既に処理された頂点は飛ばす
-            if current_dist > dist[current]:
-                continue
-            
-            # 隣接する頂点を調べる
-            for next_node, cost in graph[current]:
-                # より短い経路が見つかった場合は更新
-                if dist[next_node] > dist[current] + cost:
-                    dist[next_node] = dist[current] + cost
-                    heapq.heappush(priority_queue, (dist[next_node], next_node))
-        
-        # ゴールまでの距離を返す（到達不可能な場合は-1）
-        return dist[goal] if dist[goal] != float('inf') else -1
-    
-    # 頂点1から頂点Nまでの最短経路を計算
-    result = dijkstra(1, N)
-    print(result)
+    # 頂点1から頂点Nまでの最短経路を計算（到達不可能な場合は-1）
+    dist = dijkstra(graph, 1, goal=N)
+    print(dist[N] if dist[N] != INF else -1)
 
 
 if __name__ == "__main__":
     solve()
-"""
@@ -39,79 +39,632 @@ AtCoder セグメント木問題
 2
 """
 
+from array import array
+import math
+import sys
+
 def mysolution():
     # 実装を試みてください
     pass
 
-"""
+# 整数版セグメント木で float('inf') の代わりに使う番兵
+INT64_MAX = (1 << 63) - 1
+INT64_MIN = -(1 << 63)
+
+def int64_identity(initial_value):
+    """無限大は整数の配列に入らないので、整数の番兵に置き換える"""
+    if initial_value == float('inf'):
+        return INT64_MAX
+    if initial_value == -float('inf'):
+        return INT64_MIN
+    return initial_value
+
+def numpy_operation(operation):
+    """まとめて処理するAPIで、operation に対応させる NumPy の関数を返す（なければ None）"""
+    # NumPy はまとめて処理するAPIでだけ使うので、使うときに読み込む
+    import numpy as np
+    return {min: np.minimum, max: np.maximum, math.gcd: np.gcd}.get(operation)
+
 class SegmentTree:
-    \"\"\"
-    セグメント木の実装
+    """
+    セグメント木の実装（非再帰・ボトムアップ版）
     
     区間に対する操作（最小値、最大値、和など）を効率的に行うデータ構造
-    各操作が O(log N) で実行できる
-    \"\"\"
-    def __init__(self, n, initial_value=float('inf'), operation=min):
-        \"\"\"初期化\"\"\"
+    各操作が O(log N) で実行できる（構築は O(N)）
+    
+    木は1-indexedの配列で表現する：
+    - tree[1] が根、tree[k] の子は tree[2k] と tree[2k+1]
+    - 葉は tree[n] ～ tree[2n-1] に並ぶ
+    
+    compact=True にすると、値を Python のリストではなく array('q')
+    （64bit整数の配列）に詰めて持つ。1ノードあたり8バイトで済むため、
+    N=10^6 程度の大きな木でもメモリを大きく節約できる。
+    この場合、値はすべて64bit整数に収まる必要がある
+    （単位元の float('inf') / -float('inf') は INT64_MAX / INT64_MIN に置き換える）。
+    """
+    def __init__(self, n, initial_value=float('inf'), operation=min, compact=False):
+        """初期化"""
         # 要素数以上の最小の2のべき乗を計算
         self.n = 1
         while self.n < n:
             self.n *= 2
         
-        # セグメント木の配列を初期化
-        self.tree = [initial_value] * (2 * self.n - 1)
+        # セグメント木の配列を初期化（tree[0]は使わない）
+        if compact:
+            initial_value = int64_identity(initial_value)
+            self.tree = array('q', [initial_value]) * (2 * self.n)
+        else:
+            self.tree = [initial_value] * (2 * self.n)
+        self.size = n
         self.initial_value = initial_value
         self.operation = operation
+        self.compact = compact
     
     def update(self, i, x):
-        \"\"\"i番目の要素をxに更新\"\"\"
+        """i番目の要素をxに更新"""
+        tree = self.tree
+        op = self.operation
         # 葉のノードのインデックスを計算
-        i += self.n - 1
+        i += self.n
         # 葉のノードの値を更新
-        self.tree[i] = x
+        tree[i] = x
         # 親のノードを更新
-        while i > 0:
-            i = (i - 1) // 2
-            self.tree[i] = self.operation(self.tree[2 * i + 1], self.tree[2 * i + 2])
+        i >>= 1
+        while i:
+            tree[i] = op(tree[2 * i], tree[2 * i + 1])
+            i >>= 1
+    
+    def query(self, a, b):
+        """区間[a, b)の演算結果を取得"""
+        tree = self.tree
+        op = self.operation
+        # 左端・右端からそれぞれ集めた値（演算の順序を保つため分けて持つ）
+        vl = self.initial_value
+        vr = self.initial_value
+        
+        # 葉から根に向かって、区間の両端を1段ずつ狭めていく
+        a += self.n
+        b += self.n
+        while a < b:
+            if a & 1:
+                # 左端が右の子なら、そのノードを使って右隣へ進む
+                vl = op(vl, tree[a])
+                a += 1
+            if b & 1:
+                # 右端が右の子なら、その左隣のノードを使う
+                b -= 1
+                vr = op(tree[b], vr)
+            a >>= 1
+            b >>= 1
+        return op(vl, vr)
+
+    def build(self, arr):
+        """配列からセグメント木を構築"""
+        tree = self.tree
+        op = self.operation
+        # 葉のノードに値を一度に設定
+        if self.compact:
+            arr = array('q', arr)
+        tree[self.n:self.n + len(arr)] = arr
+        # 親のノードを下から順に1回ずつ計算
+        for i in range(self.n - 1, 0, -1):
+            tree[i] = op(tree[2 * i], tree[2 * i + 1])
+
+    def max_right(self, l, pred):
+        """
+        pred(区間[l, r)の演算結果) が真となる最大の r を返す
+        
+        pred は単調（区間を伸ばして一度偽になったら、以降も偽）で、
+        pred(initial_value) は真である必要がある。
+        例: l から見て最小値が初めて x 未満になる位置は
+            max_right(l, lambda v: v >= x)
+        二分探索の中で query を呼ぶと O(log^2 N) かかるが、
+        木を1回下るだけなので O(log N) で求まる。
+        """
+        if l == self.size:
+            return self.size
+        tree = self.tree
+        op = self.operation
+        l += self.n
+        acc = self.initial_value
+        while True:
+            # 区間の左端になれる一番大きなノードまで上る
+            while l % 2 == 0:
+                l >>= 1
+            if not pred(op(acc, tree[l])):
+                # このノードの中に境界があるので、葉まで下って探す
+                while l < self.n:
+                    l *= 2
+                    if pred(op(acc, tree[l])):
+                        acc = op(acc, tree[l])
+                        l += 1
+                return l - self.n
+            acc = op(acc, tree[l])
+            l += 1
+            # 右端まで進んだら終了
+            if l & -l == l:
+                break
+        return self.size
+
+    def min_left(self, r, pred):
+        """
+        pred(区間[l, r)の演算結果) が真となる最小の l を返す
+        
+        max_right を左右反転したもので、pred の条件も同じ。
+        """
+        if r == 0:
+            return 0
+        tree = self.tree
+        op = self.operation
+        r += self.n
+        acc = self.initial_value
+        while True:
+            r -= 1
+            # 区間の右端になれる一番大きなノードまで上る
+            while r > 1 and r % 2:
+                r >>= 1
+            if not pred(op(tree[r], acc)):
+                # このノードの中に境界があるので、葉まで下って探す
+                while r < self.n:
+                    r = 2 * r + 1
+                    if pred(op(tree[r], acc)):
+                        acc = op(tree[r], acc)
+                        r -= 1
+                return r + 1 - self.n
+            acc = op(tree[r], acc)
+            # 左端まで進んだら終了
+            if r & -r == r:
+                break
+        return 0
+
+    def _numpy_view(self, ufunc):
+        """まとめて処理するAPI用に、木の配列と NumPy の演算を用意する"""
+        import numpy as np
+        if not self.compact:
+            raise ValueError("query_many / update_many は compact=True の木でのみ使えます")
+        if ufunc is None:
+            ufunc = numpy_operation(self.operation)
+            if ufunc is None:
+                raise ValueError("operation に対応する NumPy の関数を ufunc で指定してください")
+        # array('q') のメモリをそのまま int64 の配列として扱う（コピーしない）
+        return np.frombuffer(self.tree, dtype=np.int64), ufunc
+
+    def query_many(self, ls, rs, ufunc=None):
+        """
+        複数の区間[ls[j], rs[j])の演算結果をまとめて取得
+        
+        全クエリの左端・右端を配列で持ち、1段ずつ同時に根へ上っていく。
+        Pythonのループは木の高さ分（O(log N)回）だけで済む。
+        ufunc には operation に対応する NumPy の関数（np.add など）を渡す
+        （min / max は自動で選ぶ）。演算は可換である必要がある。
+        """
+        import numpy as np
+        tree, ufunc = self._numpy_view(ufunc)
+        l = np.asarray(ls, dtype=np.int64) + self.n
+        r = np.asarray(rs, dtype=np.int64) + self.n
+        result = np.full(len(l), self.initial_value, dtype=np.int64)
+        
+        while True:
+            active = l < r
+            if not active.any():
+                break
+            # 左端が右の子のクエリは、そのノードを使って右隣へ進む
+            take = active & (l & 1 == 1)
+            result = np.where(take, ufunc(result, tree[np.where(take, l, 0)]), result)
+            l += take
+            # 右端が右の子のクエリは、その左隣のノードを使う
+            take = active & (r & 1 == 1)
+            r -= take
+            result = np.where(take, ufunc(result, tree[np.where(take, r, 0)]), result)
+            l >>= 1
+            r >>= 1
+        return result
+
+    def update_many(self, idx, vals, ufunc=None):
+        """
+        idx[j]番目の要素をvals[j]にまとめて更新
+        
+        同じ位置が複数回現れた場合は、後のものが有効になる。
+        葉を一度に書き換えてから、変わったノードの親だけを1段ずつ計算し直す。
+        """
+        import numpy as np
+        tree, ufunc = self._numpy_view(ufunc)
+        idx = np.asarray(idx, dtype=np.int64) + self.n
+        vals = np.asarray(vals, dtype=np.int64)
+        if len(idx) == 0:
+            return
+        
+        # 同じ位置への更新は最後のものだけ残す
+        _, last = np.unique(idx[::-1], return_index=True)
+        keep = len(idx) - 1 - last
+        tree[idx[keep]] = vals[keep]
+        
+        # 葉はすべて同じ深さなので、親も1段ずつ同じ深さのものをまとめて計算できる
+        nodes = np.unique(idx[keep] >> 1)
+        while nodes[0] > 0:
+            tree[nodes] = ufunc(tree[2 * nodes], tree[2 * nodes + 1])
+            nodes = np.unique(nodes >> 1)
+
+class LazySegmentTree:
+    """
+    遅延伝播セグメント木の実装
     
-    def query(self, a, b, k=0, l=0, r=None):
-        \"\"\"区間[a, b)の演算結果を取得\"\"\"
-        if r is None:
-            r = self.n
+    区間への一括操作（区間加算、区間代入など）と区間の演算結果の取得を
+    どちらも O(log N) で行うデータ構造
+    
+    扱う演算は引数で与える：
+    - operation(x, y): 区間の値をまとめる演算（min, 和など）
+    - initial_value: operation の単位元
+    - mapping(f, x): 操作fを値xに作用させた結果
+    - composition(f, g): 操作gの後に操作fを行うことを1つの操作にまとめたもの
+    - lazy_identity: 何もしない操作
+    
+    例: 区間加算・区間最小値
+        LazySegmentTree(N, min, float('inf'),
+                        lambda f, x: x + f, lambda f, g: f + g, 0)
+    例: 区間加算・区間和（値を (和, 区間の長さ) の組で持つ）
+        LazySegmentTree(N, lambda x, y: (x[0] + y[0], x[1] + y[1]), (0, 0),
+                        lambda f, x: (x[0] + f * x[1], x[1]),
+                        lambda f, g: f + g, 0)
+    """
+    def __init__(self, n, operation, initial_value, mapping, composition, lazy_identity):
+        """初期化"""
+        # 要素数以上の最小の2のべき乗と、木の高さを計算
+        self.n = 1
+        self.log = 0
+        while self.n < n:
+            self.n *= 2
+            self.log += 1
         
-        # 範囲外なら初期値を返す
-        if r <= a or b <= l:
+        # 値の配列（1-indexed）と、まだ子に伝えていない操作の配列
+        self.tree = [initial_value] * (2 * self.n)
+        self.lazy = [lazy_identity] * self.n
+        self.operation = operation
+        self.initial_value = initial_value
+        self.mapping = mapping
+        self.composition = composition
+        self.lazy_identity = lazy_identity
+    
+    def _pull(self, k):
+        """ノードkの値を子から計算し直す"""
+        self.tree[k] = self.operation(self.tree[2 * k], self.tree[2 * k + 1])
+    
+    def _apply_node(self, k, f):
+        """ノードkに操作fを作用させ、子へ伝える分を溜めておく"""
+        self.tree[k] = self.mapping(f, self.tree[k])
+        if k < self.n:
+            self.lazy[k] = self.composition(f, self.lazy[k])
+    
+    def _push(self, k):
+        """ノードkに溜まっている操作を子に伝える"""
+        f = self.lazy[k]
+        if f != self.lazy_identity:
+            self._apply_node(2 * k, f)
+            self._apply_node(2 * k + 1, f)
+            self.lazy[k] = self.lazy_identity
+    
+    def build(self, arr):
+        """配列から遅延セグメント木を構築"""
+        tree = self.tree
+        tree[self.n:self.n + len(arr)] = arr
+        for i in range(self.n - 1, 0, -1):
+            self._pull(i)
+    
+    def update(self, i, x):
+        """i番目の要素をxに更新"""
+        i += self.n
+        # 根から葉までの操作を先に伝えておく
+        for h in range(self.log, 0, -1):
+            self._push(i >> h)
+        self.tree[i] = x
+        for h in range(1, self.log + 1):
+            self._pull(i >> h)
+    
+    def query(self, a, b):
+        """区間[a, b)の演算結果を取得"""
+        if a >= b:
             return self.initial_value
+        tree = self.tree
+        op = self.operation
+        a += self.n
+        b += self.n
+        # 区間の両端に関わるノードの操作を先に伝えておく
+        for h in range(self.log, 0, -1):
+            if ((a >> h) << h) != a:
+                self._push(a >> h)
+            if ((b >> h) << h) != b:
+                self._push((b - 1) >> h)
+        
+        vl = self.initial_value
+        vr = self.initial_value
+        while a < b:
+            if a & 1:
+                vl = op(vl, tree[a])
+                a += 1
+            if b & 1:
+                b -= 1
+                vr = op(tree[b], vr)
+            a >>= 1
+            b >>= 1
+        return op(vl, vr)
+    
+    def apply(self, a, b, f):
+        """区間[a, b)の各要素に操作fを作用させる"""
+        if a >= b:
+            return
+        a += self.n
+        b += self.n
+        for h in range(self.log, 0, -1):
+            if ((a >> h) << h) != a:
+                self._push(a >> h)
+            if ((b >> h) << h) != b:
+                self._push((b - 1) >> h)
         
-        # 範囲内なら現在のノードの値を返す
-        if a <= l and r <= b:
-            return self.tree[k]
+        # 区間をちょうど覆うノードに操作を作用させる
+        l, r = a, b
+        while l < r:
+            if l & 1:
+                self._apply_node(l, f)
+                l += 1
+            if r & 1:
+                r -= 1
+                self._apply_node(r, f)
+            l >>= 1
+            r >>= 1
         
-        # 左右の子ノードを再帰的に検索
-        mid = (l + r) // 2
-        vl = self.query(a, b, 2 * k + 1, l, mid)
-        vr = self.query(a, b, 2 * k + 2, mid, r)
-        return self.operation(vl, vr)
+        # 操作したノードの祖先の値を計算し直す
+        for h in range(1, self.log + 1):
+            if ((a >> h) << h) != a:
+                self._pull(a >> h)
+            if ((b >> h) << h) != b:
+                self._pull((b - 1) >> h)
 
+class PersistentSegmentTree:
+    """
+    永続セグメント木の実装
+    
+    更新のたびに新しい版（バージョン）の根を返し、過去のどの版に対しても
+    区間の演算結果を O(log N) で求められるデータ構造
+    
+    更新では根から葉までの O(log N) 個のノードだけを複製し、
+    それ以外の部分木は前の版と共有する（経路コピー）。
+    ノードはオブジェクトにせず、左の子・右の子・値の3本の配列で管理する。
+    ノード0は「全要素が単位元の木」を表し、左右の子が自分自身になっている。
+    """
+    def __init__(self, n, initial_value=float('inf'), operation=min, compact=False):
+        """初期化"""
+        # 要素数以上の最小の2のべき乗と、木の高さを計算
+        self.n = 1
+        self.log = 0
+        while self.n < n:
+            self.n *= 2
+            self.log += 1
+        
+        # ノードの配列（ノード0は単位元だけの木）
+        self.left = array('i', [0])
+        self.right = array('i', [0])
+        if compact:
+            initial_value = int64_identity(initial_value)
+            self.value = array('q', [initial_value])
+        else:
+            self.value = [initial_value]
+        self.initial_value = initial_value
+        self.operation = operation
+    
+    def _new_node(self, l, r, x):
+        """子がl, rで値がxのノードを作り、その番号を返す"""
+        self.left.append(l)
+        self.right.append(r)
+        self.value.append(x)
+        return len(self.value) - 1
+    
+    def empty(self):
+        """全要素が単位元の版の根を返す"""
+        return 0
+    
     def build(self, arr):
-        \"\"\"配列からセグメント木を構築\"\"\"
-        # 葉のノードに値を設定
-        for i, val in enumerate(arr):
-            self.update(i, val)
+        """配列から最初の版を構築し、その根を返す"""
+        value = self.value
+        op = self.operation
+        level = [self._new_node(0, 0, x) for x in arr]
+        level += [0] * (self.n - len(arr))
+        # 葉から1段ずつ親を作っていく
+        while len(level) > 1:
+            level = [self._new_node(level[i], level[i + 1], op(value[level[i]], value[level[i + 1]]))
+                     for i in range(0, len(level), 2)]
+        return level[0]
+    
+    def update(self, root, i, x):
+        """版rootのi番目の要素をxにした新しい版を作り、その根を返す"""
+        left = self.left
+        right = self.right
+        value = self.value
+        op = self.operation
+        
+        # 根から葉までの経路を記録する（iのビットが左右のどちらに進むかを表す）
+        path = []
+        node = root
+        for h in range(self.log - 1, -1, -1):
+            path.append(node)
+            node = right[node] if (i >> h) & 1 else left[node]
+        
+        # 葉から根に向かって、経路上のノードだけを複製する
+        node = self._new_node(0, 0, x)
+        for h in range(self.log):
+            parent = path[self.log - 1 - h]
+            if (i >> h) & 1:
+                l, r = left[parent], node
+            else:
+                l, r = node, right[parent]
+            node = self._new_node(l, r, op(value[l], value[r]))
+        return node
+    
+    def query(self, root, a, b):
+        """版rootの区間[a, b)の演算結果を取得"""
+        left = self.left
+        right = self.right
+        value = self.value
+        op = self.operation
+        result = self.initial_value
+        
+        # 再帰の代わりにスタックで左から順にノードを調べる
+        stack = [(root, 0, self.n)]
+        while stack:
+            node, l, r = stack.pop()
+            # 範囲外なら何もしない
+            if r <= a or b <= l:
+                continue
+            # 範囲内ならノードの値を使う
+            if a <= l and r <= b:
+                result = op(result, value[node])
+                continue
+            mid = (l + r) // 2
+            stack.append((right[node], mid, r))
+            stack.append((left[node], l, mid))
+        return result
+
+class DynamicSegmentTree:
+    """
+    動的セグメント木の実装
+    
+    添字の範囲[0, n)が 10^18 のように巨大でも、実際に触れた位置の分だけ
+    ノードを作るセグメント木。座標圧縮をせずにオンラインで
+    更新・区間の演算結果の取得ができる（どちらも O(log n)）。
+    
+    ノードは永続セグメント木と同じく、左の子・右の子・値の3本の配列で管理する。
+    ノード0は「まだ作られていない部分木」を表し、値は単位元になっている。
+    """
+    def __init__(self, n, initial_value=float('inf'), operation=min, compact=False):
+        """初期化"""
+        # 要素数以上の最小の2のべき乗を、木の高さで表す
+        self.log = max(n - 1, 0).bit_length()
+        self.n = 1 << self.log
+        
+        # ノードの配列（ノード0は空の部分木、ノード1は根）
+        if compact:
+            initial_value = int64_identity(initial_value)
+            self.value = array('q', [initial_value, initial_value])
+        else:
+            self.value = [initial_value, initial_value]
+        self.left = array('i', [0, 0])
+        self.right = array('i', [0, 0])
+        self.initial_value = initial_value
+        self.operation = operation
+    
+    def _new_node(self):
+        """値が単位元の葉ノードを作り、その番号を返す"""
+        self.left.append(0)
+        self.right.append(0)
+        self.value.append(self.initial_value)
+        return len(self.value) - 1
+    
+    def update(self, i, x):
+        """i番目の要素をxに更新"""
+        left = self.left
+        right = self.right
+        value = self.value
+        op = self.operation
+        
+        # 根から葉まで下り、まだないノードはここで作る
+        path = []
+        node = 1
+        for h in range(self.log - 1, -1, -1):
+            path.append(node)
+            if (i >> h) & 1:
+                if right[node] == 0:
+                    right[node] = self._new_node()
+                node = right[node]
+            else:
+                if left[node] == 0:
+                    left[node] = self._new_node()
+                node = left[node]
+        value[node] = x
+        
+        # 経路上のノードを葉に近い方から計算し直す
+        for node in reversed(path):
+            value[node] = op(value[left[node]], value[right[node]])
+    
+    def query(self, a, b):
+        """区間[a, b)の演算結果を取得"""
+        left = self.left
+        right = self.right
+        value = self.value
+        op = self.operation
+        result = self.initial_value
+        
+        # 再帰の代わりにスタックで左から順にノードを調べる
+        stack = [(1, 0, self.n)]
+        while stack:
+            node, l, r = stack.pop()
+            # まだ作られていない部分木や範囲外なら何もしない
+            if node == 0 or r <= a or b <= l:
+                continue
+            # 範囲内ならノードの値を使う
+            if a <= l and r <= b:
+                result = op(result, value[node])
+                continue
+            mid = (l + r) // 2
+            stack.append((right[node], mid, r))
+            stack.append((left[node], l, mid))
+        return result
+
+class SparseTable:
+    """
+    スパーステーブルの実装
+    
+    値の更新がない配列に対して、区間の最小値・最大値・最大公約数などを
+    O(1) で求めるデータ構造（構築は O(N log N)）
+    
+    table[k][i] に区間[i, i + 2^k)の演算結果を持っておき、
+    区間[a, b)は長さ 2^k の2つの区間（重なってもよい）に分けて答える。
+    そのため operation は min / max / math.gcd のように、
+    同じ要素を2回使っても結果が変わらない演算である必要がある。
+    initial_value は SegmentTree と同じく operation の単位元で、
+    空の区間を求めたときに返す。
+    """
+    def __init__(self, arr, operation=min, initial_value=float('inf')):
+        """配列からスパーステーブルを構築"""
+        import numpy as np
+        ufunc = numpy_operation(operation)
+        if ufunc is None:
+            raise ValueError("SparseTable の operation は min / max / math.gcd のいずれかにしてください")
+        level = np.array(arr, dtype=np.int64)
+        self.operation = operation
+        self.initial_value = initial_value
+        self.table = [array('q', level.tobytes())]
+        
+        # 長さ 2^k の区間の結果は、長さ 2^(k-1) の区間2つをずらして重ねて計算できる
+        n = len(level)
+        half = 1
+        while 2 * half <= n:
+            level = ufunc(level[:-half], level[half:])
+            self.table.append(array('q', level.tobytes()))
+            half *= 2
+    
+    def query(self, a, b):
+        """区間[a, b)の演算結果を取得"""
+        if a >= b:
+            return self.initial_value
+        k = (b - a).bit_length() - 1
+        row = self.table[k]
+        return self.operation(row[a], row[b - (1 << k)])
 
 def solve():
     # 入力を受け取る
     N, Q = map(int, input().split())
     A = list(map(int, input().split()))
+    queries = [list(map(int, input().split())) for _ in range(Q)]
     
-    # セグメント木の初期化と構築
-    seg = SegmentTree(N)
-    seg.build(A)
+    if any(query[0] == 1 for query in queries):
+        # セグメント木の初期化と構築
+        seg = SegmentTree(N)
+        seg.build(A)
+    else:
+        # 更新がなければ O(1) で答えられるスパーステーブルを使う
+        seg = SparseTable(A)
     
     # クエリを処理
-    for _ in range(Q):
-        query = list(map(int, input().split()))
-        
+    for query in queries:
         if query[0] == 1:
             # 更新クエリ
             x, v = query[1], query[2]
@@ -121,7 +674,38 @@ def solve():
             l, r = query[1], query[2]
             print(seg.query(l - 1, r))  # [l, r]を[l-1, r)に変換
 
+def solve_batch():
+    """
+    solve() と同じ入力を、まとめて処理するAPIで解く版
+    
+    入力を一度に読み込み、連続する更新クエリ・区間最小値クエリを
+    それぞれ update_many / query_many で一括処理する
+    """
+    import numpy as np
+    data = np.array(sys.stdin.buffer.read().split(), dtype=np.int64)
+    N, Q = int(data[0]), int(data[1])
+    A = data[2:2 + N]
+    queries = data[2 + N:2 + N + 3 * Q].reshape(Q, 3)
+    
+    seg = SegmentTree(N, compact=True)
+    seg.build(A.tolist())
+    
+    # 種類が同じクエリが続く区間ごとに分ける
+    kinds = queries[:, 0]
+    starts = np.flatnonzero(np.r_[True, kinds[1:] != kinds[:-1]])
+    ends = np.r_[starts[1:], Q]
+    
+    answers = []
+    for s, e in zip(starts.tolist(), ends.tolist()):
+        block = queries[s:e]
+        if kinds[s] == 1:
+            seg.update_many(block[:, 1] - 1, block[:, 2])
+        else:
+            answers.append(seg.query_many(block[:, 1] - 1, block[:, 2]))
+    
+    if answers:
+        print("\n".join(map(str, np.concatenate(answers).tolist())))
 
-if __name__ == \"__main__\":
+
+if __name__ == "__main__":
     solve()
-"""
@@ -0,0 +1,266 @@
+"""
+AtCoder フェニック木（Binary Indexed Tree）問題
+
+問題:
+長さNの数列A=[A_1, A_2, ..., A_N]があります。
+以下の2種類のクエリを処理してください。
+
+1. 1 x v: A_xにvを加える
+2. 2 l r: A_l + A_(l+1) + ... + A_r を求める
+
+入力:
+1行目: 数列の長さ N とクエリ数 Q
+2行目: 数列 A_1, A_2, ..., A_N
+3行目以降: Q行のクエリ。各行は「t x v」または「t l r」の形式
+
+出力:
+クエリ2に対する回答を各行に出力
+
+制約:
+1 <= N, Q <= 2 * 10^5
+1 <= A_i, v <= 10^9
+1 <= l <= r <= N
+
+入力例:
+5 5
+1 2 3 4 5
+2 1 5
+1 3 10
+2 2 4
+1 5 5
+2 3 5
+
+出力例:
+15
+19
+27
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+
+def mysolution():
+    # 実装を試みてください
+    pass
+
+class FenwickTree:
+    """
+    フェニック木（Binary Indexed Tree, BIT）の実装
+
+    1点への加算と区間和の取得を O(log N) で行うデータ構造
+    累積和（04_累積和.py）は値が変わると作り直しが必要だが、
+    フェニック木なら値を変えながら区間和を求められる。
+    和だけを扱うならセグメント木より配列が半分で済み、処理も軽い。
+
+    木は1-indexedの配列で表現する：
+    - tree[i] は区間(i - (i & -i), i]の和を持つ
+
+    compact=True にすると、値を array('q')（64bit整数の配列）に詰めて持つ。
+    """
+    def __init__(self, n, compact=False):
+        """初期化"""
+        self.n = n
+        if compact:
+            self.tree = array('q', [0]) * (n + 1)
+        else:
+            self.tree = [0] * (n + 1)
+
+    def build(self, arr):
+        """配列からフェニック木を O(N) で構築"""
+        tree = self.tree
+        n = self.n
+        for i, val in enumerate(arr, 1):
+            tree[i] = val
+        # 各ノードの値を、それを含む1つ上のノードに足し込む
+        for i in range(1, n + 1):
+            j = i + (i & -i)
+            if j <= n:
+                tree[j] += tree[i]
+
+    def add(self, i, x):
+        """i番目の要素にxを加える"""
+        tree = self.tree
+        i += 1
+        while i <= self.n:
+            tree[i] += x
+            i += i & -i
+
+    def prefix_sum(self, r):
+        """区間[0, r)の和を取得"""
+        tree = self.tree
+        s = 0
+        while r > 0:
+            s += tree[r]
+            r -= r & -r
+        return s
+
+    def sum(self, l, r):
+        """区間[l, r)の和を取得"""
+        return self.prefix_sum(r) - self.prefix_sum(l)
+
+    def lower_bound(self, w):
+        """
+        区間[0, i]の和が w 以上になる最小の i を返す（なければ N）
+
+        すべての要素が0以上である必要がある。
+        大きい区間から順に、足しても w に届かないなら進む、を繰り返して
+        木を1回下るだけなので O(log N) で求まる。
+        """
+        if w <= 0:
+            return 0
+        # 要素がなければ木を下れないので、そのまま N（= 0）を返す
+        if self.n == 0:
+            return 0
+        tree = self.tree
+        x = 0
+        k = 1 << (self.n.bit_length() - 1)
+        while k:
+            if x + k <= self.n and tree[x + k] < w:
+                w -= tree[x + k]
+                x += k
+            k >>= 1
+        return x
+
+class FenwickTree2D:
+    """
+    2次元フェニック木の実装
+
+    H×Wのグリッドに対して、1マスへの加算と長方形領域の和の取得を
+    O(log H log W) で行うデータ構造
+    2次元累積和（04補足_累積和入門.md の calculate_2d_cumsum）は
+    1マス変わるたびに O(HW) で作り直す必要があるが、こちらは作り直し不要。
+
+    tree は (H+1)×(W+1) の表を1次元に並べて持つ（tree[i * (W+1) + j]）。
+    """
+    def __init__(self, h, w, compact=False):
+        """初期化"""
+        self.h = h
+        self.w = w
+        if compact:
+            self.tree = array('q', [0]) * ((h + 1) * (w + 1))
+        else:
+            self.tree = [0] * ((h + 1) * (w + 1))
+
+    def build(self, matrix):
+        """2次元配列から O(HW) で構築"""
+        tree = self.tree
+        h, w = self.h, self.w
+        stride = w + 1
+        for i, row in enumerate(matrix, 1):
+            for j, val in enumerate(row, 1):
+                tree[i * stride + j] = val
+        # 横方向に、各ノードの値をそれを含む1つ右のノードに足し込む
+        for i in range(1, h + 1):
+            base = i * stride
+            for j in range(1, w + 1):
+                k = j + (j & -j)
+                if k <= w:
+                    tree[base + k] += tree[base + j]
+        # 縦方向にも同じことをする
+        for i in range(1, h + 1):
+            k = i + (i & -i)
+            if k <= h:
+                for j in range(1, w + 1):
+                    tree[k * stride + j] += tree[i * stride + j]
+
+    def add(self, y, x, v):
+        """マス(y, x)にvを加える"""
+        tree = self.tree
+        stride = self.w + 1
+        i = y + 1
+        while i <= self.h:
+            j = x + 1
+            while j <= self.w:
+                tree[i * stride + j] += v
+                j += j & -j
+            i += i & -i
+
+    def prefix_sum(self, y, x):
+        """領域[0, y)×[0, x)の和を取得"""
+        tree = self.tree
+        stride = self.w + 1
+        s = 0
+        i = y
+        while i > 0:
+            j = x
+            while j > 0:
+                s += tree[i * stride + j]
+                j -= j & -j
+            i -= i & -i
+        return s
+
+    def rectangle_sum(self, y1, x1, y2, x2):
+        """長方形領域の和を取得（左上(y1,x1)から右下(y2,x2)まで、0-indexed）"""
+        return (self.prefix_sum(y2 + 1, x2 + 1) - self.prefix_sum(y1, x2 + 1)
+                - self.prefix_sum(y2 + 1, x1) + self.prefix_sum(y1, x1))
+
+class OfflineRectangleSum:
+    """
+    座標で与えられた点の集合に対する長方形領域の和を、まとめて求める
+
+    座標が 10^9 のように大きくてグリッドを作れない場合に使う。
+    rectangle_sum でクエリを登録しておき、answers() で一度に答える。
+    y座標の小さい順に点を入れながら（平面走査）、x座標を圧縮した
+    フェニック木で和を取るので、全体で O((N + Q) log N)。
+    """
+    def __init__(self, points):
+        """points: (y, x, 重み) の組のリスト"""
+        self.points = sorted(points)
+        self.xs = sorted(set(x for _, x, _ in points))
+        self.queries = []
+
+    def rectangle_sum(self, y1, x1, y2, x2):
+        """長方形領域（左上(y1,x1)から右下(y2,x2)まで）のクエリを登録し、その番号を返す"""
+        self.queries.append((y1, x1, y2, x2))
+        return len(self.queries) - 1
+
+    def answers(self):
+        """登録順に各クエリの答えを返す"""
+        xs = self.xs
+        # 各クエリを「y座標が Y 未満の点の、x座標が範囲内の和」の差に分ける
+        events = []
+        for k, (y1, x1, y2, x2) in enumerate(self.queries):
+            l = bisect_left(xs, x1)
+            r = bisect_right(xs, x2)
+            events.append((y2 + 1, l, r, k, 1))
+            events.append((y1, l, r, k, -1))
+        events.sort()
+
+        bit = FenwickTree(len(xs))
+        result = [0] * len(self.queries)
+        points = self.points
+        p = 0
+        for Y, l, r, k, sign in events:
+            # y座標が Y 未満の点をすべて入れる
+            while p < len(points) and points[p][0] < Y:
+                _, x, weight = points[p]
+                bit.add(bisect_left(xs, x), weight)
+                p += 1
+            result[k] += sign * bit.sum(l, r)
+        return result
+
+def solve():
+    # 入力を受け取る
+    N, Q = map(int, input().split())
+    A = list(map(int, input().split()))
+
+    # フェニック木の初期化と構築
+    bit = FenwickTree(N)
+    bit.build(A)
+
+    # クエリを処理
+    for _ in range(Q):
+        query = list(map(int, input().split()))
+
+        if query[0] == 1:
+            # 加算クエリ
+            x, v = query[1], query[2]
+            bit.add(x - 1, v)  # 0-indexedに変換
+        else:
+            # 区間和クエリ
+            l, r = query[1], query[2]
+            print(bit.sum(l - 1, r))  # [l, r]を[l-1, r)に変換
+
+
+if __name__ == "__main__":
+    solve()